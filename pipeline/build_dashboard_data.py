@@ -17,16 +17,21 @@ Usage:
     python build_dashboard_data.py --input scraped.json --output-dir ../app/public/data
 """
 
-import json
-import csv
 import argparse
+import hashlib
+import heapq
+import re
 import statistics
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 from typing import Optional
 
+import orjson
+import polars as pl
+
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 def parse_price(raw: str) -> Optional[float]:
@@ -60,202 +65,407 @@ def volatility_label(cv: Optional[float]) -> str:
 # ─── Load Input ───────────────────────────────────────────────────────────────
 
 def load_market_data(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
+
+
+# ─── Incremental Cache ────────────────────────────────────────────────────────
+#
+# The aggregated group stats are treated as a materialized view: each
+# (region, category) cell of the input is fingerprinted, and on the next run
+# only cells whose fingerprint changed are re-aggregated. Cached rows for
+# unchanged cells are reused as-is, so an incremental rerun costs
+# O(changed records) instead of O(all records).
+
+# Lives next to this script, NOT under the output dir: app/public/data is
+# deployed verbatim, and the cache must never ship with the site. Entries
+# are content-fingerprinted, so sharing the cache across output dirs is safe.
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+_CELL_SEP = "\x1f"
+# Bump whenever aggregate_records changes shape or semantics, so stale
+# cached stats from an older pipeline version are discarded.
+_CACHE_VERSION = 4
+_VERSION_KEY = "__version__"
+
+
+def _cell_fingerprints(market_data: dict) -> dict[str, str]:
+    """blake2b digest of every (region, category) cell of the input."""
+    fps = {}
+    for region_name, categories in market_data.get("regions", {}).items():
+        for category, cat_data in categories.items():
+            payload = orjson.dumps(cat_data, option=orjson.OPT_SORT_KEYS)
+            digest = hashlib.blake2b(payload, digest_size=16)
+            fps[region_name + _CELL_SEP + category] = digest.hexdigest()
+    return fps
+
+
+def _load_group_cache(cache_dir: Path) -> Optional[tuple[dict, pl.DataFrame]]:
+    fp_path = cache_dir / "cell_fingerprints.json"
+    agg_path = cache_dir / "group_stats.parquet"
+    if not (fp_path.exists() and agg_path.exists()):
+        return None
+    try:
+        fps = orjson.loads(fp_path.read_bytes())
+        if fps.pop(_VERSION_KEY, None) != _CACHE_VERSION:
+            return None
+        return fps, pl.read_parquet(agg_path)
+    except Exception:  # corrupt cache → fall back to a full rebuild
+        return None
+
+
+def _save_group_cache(cache_dir: Path, fingerprints: dict, agg: pl.DataFrame):
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    agg.write_parquet(cache_dir / "group_stats.parquet")
+    (cache_dir / "cell_fingerprints.json").write_bytes(
+        orjson.dumps({_VERSION_KEY: _CACHE_VERSION, **fingerprints})
+    )
+
+
+def _keys_frame(cell_keys: list[str]) -> pl.DataFrame:
+    pairs = [k.split(_CELL_SEP, 1) for k in cell_keys]
+    return pl.DataFrame(
+        {
+            "region": [p[0] for p in pairs],
+            "category": [p[1] for p in pairs],
+        },
+        schema={"region": pl.Categorical, "category": pl.Categorical},
+    )
+
+
+def aggregate_incremental(
+    records: pl.DataFrame, fingerprints: dict, cache_dir: Path
+) -> pl.DataFrame:
+    """
+    Aggregate records, reusing cached group stats for input cells whose
+    fingerprint is unchanged since the previous run.
+    """
+    cached = _load_group_cache(cache_dir)
+    if cached is None:
+        agg = aggregate_records(records)
+    else:
+        old_fps, old_agg = cached
+        changed = [k for k, d in fingerprints.items() if old_fps.get(k) != d]
+        unchanged = [k for k in fingerprints if old_fps.get(k) == fingerprints[k]]
+        print(f"  cache: {len(unchanged)} cells unchanged, {len(changed)} re-aggregated")
+
+        parts = []
+        if unchanged:
+            parts.append(
+                old_agg.join(_keys_frame(unchanged), on=["region", "category"], how="semi")
+            )
+        if changed:
+            fresh = records.join(_keys_frame(changed), on=["region", "category"], how="semi")
+            parts.append(aggregate_records(fresh))
+        agg = pl.concat(parts) if parts else aggregate_records(records)
+
+    _save_group_cache(cache_dir, fingerprints, agg)
+    return agg
 
 
 # ─── Flatten to Records ───────────────────────────────────────────────────────
 
-def flatten_records(market_data: dict) -> list[dict]:
+# The string columns hold a handful of distinct values repeated thousands of
+# times; dictionary-encoding them as Categorical stores each distinct string
+# once plus a small integer code per row.
+RECORD_SCHEMA = {
+    "date": pl.Utf8,
+    "region": pl.Categorical,
+    "category": pl.Categorical,
+    "market": pl.Categorical,
+    "commodity": pl.Categorical,
+    "specification": pl.Categorical,
+    "price": pl.Float64,
+}
+
+
+def iter_records(market_data: dict):
     """
-    Convert the nested market_comparison_data into a flat list of records:
-        [{ region, category, market, commodity, specification, price }, ...]
+    Stream one row tuple per (region, category, market, commodity) price
+    cell, in RECORD_SCHEMA column order. Nothing is materialized here — the
+    consumer decides what to collect.
     """
-    records = []
     scrape_date = datetime.now().strftime("%Y-%m-%d")
 
+    # Intern the categorical values: downstream holds one shared str object
+    # per distinct value instead of a fresh copy per cell, and the interned
+    # keys hash/compare by pointer.
     for region_name, categories in market_data.get("regions", {}).items():
+        region_name = sys.intern(region_name)
         for category, cat_data in categories.items():
+            category = sys.intern(category)
             date = cat_data.get("date", scrape_date)
-            markets = cat_data.get("markets", [])
+            markets = [sys.intern(m) for m in cat_data.get("markets", [])]
             commodities = cat_data.get("commodities", [])
 
             for item in commodities:
-                commodity = item["commodity"]
-                spec = item.get("specification", "")
+                commodity = sys.intern(item["commodity"])
+                spec = sys.intern(item.get("specification", ""))
                 prices = item.get("prices", [])
 
                 for i, market in enumerate(markets):
                     price_str = prices[i] if i < len(prices) else "N/A"
-                    price = parse_price(price_str)
+                    yield (
+                        date,
+                        region_name,
+                        category,
+                        market,
+                        commodity,
+                        spec,
+                        parse_price(price_str),
+                    )
+
+
+def flatten_frame(market_data: dict) -> pl.DataFrame:
+    """
+    Collect the streamed records into a columnar frame, consumed exactly
+    once; the resulting frame is shared by the aggregation and the flat
+    exports.
+    """
+    return pl.DataFrame(iter_records(market_data), schema=RECORD_SCHEMA, orient="row")
 
-                    records.append({
-                        "date": date,
-                        "region": region_name,
-                        "category": category,
-                        "market": market,
-                        "commodity": commodity,
-                        "specification": spec,
-                        "price": price,
-                    })
 
-    return records
+# ─── Regional Dashboard ───────────────────────────────────────────────────────
 
+def aggregate_records(records: pl.DataFrame) -> pl.DataFrame:
+    """
+    Per-(region, category, commodity) price statistics in one group_by pass.
+    One multi-threaded columnar pass instead of per-record dict grouping +
+    statistics.mean/stdev on Python lists.
+    """
+    return (
+        records.lazy()
+        .filter(pl.col("price").is_not_null())
+        .group_by(["region", "category", "commodity"])
+        .agg([
+            pl.col("price").mean().alias("avg"),
+            pl.col("price").std().alias("stdev"),
+            pl.col("price").min().alias("pmin"),
+            pl.col("price").max().alias("pmax"),
+            pl.col("price").count().alias("n"),
+            pl.col("price").sort().alias("prices"),
+            pl.col("specification").first(),
+            pl.col("date").first(),
+        ])
+        .with_columns(
+            (pl.col("stdev") / pl.col("avg") * 100).alias("cv")
+        )
+        .with_columns(
+            # Normalize: single-market groups have no spread, null cv → 0
+            pl.when((pl.col("n") > 1) & pl.col("cv").is_not_null())
+            .then(pl.col("cv"))
+            .otherwise(0.0)
+            .alias("cv")
+        )
+        .with_columns(
+            # Same thresholds as volatility_label, evaluated vectorized
+            pl.when(pl.col("cv") < 2).then(pl.lit("Low"))
+            .when(pl.col("cv") < 5).then(pl.lit("Moderate"))
+            .when(pl.col("cv") < 10).then(pl.lit("High"))
+            .otherwise(pl.lit("Very High"))
+            .alias("volatility")
+        )
+        .collect()
+    )
 
-# ─── Regional Dashboard ───────────────────────────────────────────────────────
 
-def build_regional_dashboard(records: list[dict]) -> list[dict]:
+def build_regional_dashboard(agg: pl.DataFrame) -> tuple[list[dict], list[list[dict]]]:
     """
-    Aggregate to region × commodity level with price stats.
+    Shape the aggregated groups into DashboardItem dicts.
     Mirrors the DashboardItem type expected by the React app.
-    """
-    # Group by region + category + commodity
-    groups = defaultdict(list)
-    for r in records:
-        if r["price"] is not None:
-            key = (r["region"], r["category"], r["commodity"])
-            groups[key].append(r)
 
+    Items carry a "trend_idx" into the returned trends side-table instead of
+    an inline trend list; every output that includes trends resolves the
+    index at serialization time via _resolve_trends, so each trend is
+    materialized once and shared instead of duplicated per output.
+    """
     dashboard = []
-    for (region, category, commodity), items in groups.items():
-        prices = [it["price"] for it in items if it["price"] is not None]
-        if not prices:
-            continue
-
-        avg_price = round(statistics.mean(prices), 2)
-        spec = items[0].get("specification", "")
-        date = items[0].get("date", "")
-
-        # Coefficient of variation as proxy volatility
-        if len(prices) > 1:
-            stdev = statistics.stdev(prices)
-            cv = (stdev / avg_price * 100) if avg_price else 0
-        else:
-            cv = 0
-
-        vol_label = volatility_label(cv)
-
-        # Trend: just the market-level prices sorted (no time series from one scrape)
-        trend = [
+    trends: list[list[dict]] = []
+    for row in agg.iter_rows(named=True):
+        avg_price = round(row["avg"], 2)
+        date = row["date"] or ""
+
+        # Trend: just the market-level prices, pre-sorted by the aggregation
+        # (no time series from one scrape)
+        trends.append([
             {"date": date, "price": p}
-            for p in sorted(prices)
-        ]
+            for p in row["prices"]
+        ])
 
         dashboard.append({
-            "region": region,
-            "category": category,
-            "commodity": commodity,
-            "unit": _infer_unit(spec, category),
+            "region": row["region"],
+            "category": row["category"],
+            "commodity": row["commodity"],
+            "unit": _infer_unit(row["specification"] or "", row["category"]),
             "latest_price": avg_price,
             "latest_date": date,
             "ma_7": None,       # Requires time-series data (multiple scrapes)
             "ma_30": None,
             "7_day_change_pct": None,
             "30_day_change_pct": None,
-            "volatility_score": vol_label,
-            "volatility_value": round(cv, 2),
+            "volatility_score": row["volatility"],
+            "volatility_value": round(row["cv"], 2),
             "momentum": 0,
-            "trend": trend,
-            "price_min": min(prices),
-            "price_max": max(prices),
-            "markets_count": len(prices),
+            "trend_idx": len(trends) - 1,
+            "price_min": row["pmin"],
+            "price_max": row["pmax"],
+            "markets_count": row["n"],
         })
 
-    return sorted(dashboard, key=lambda x: (x["region"], x["category"], x["commodity"]))
+    dashboard.sort(key=lambda x: (x["region"], x["category"], x["commodity"]))
+    return dashboard, trends
+
+
+def _resolve_trends(items: list[dict], trends: list[list[dict]]) -> list[dict]:
+    """Swap each item's trend_idx for the shared trend list it points at."""
+    resolved = []
+    for it in items:
+        out_item = {}
+        for k, v in it.items():
+            if k == "trend_idx":
+                out_item["trend"] = trends[v]
+            else:
+                out_item[k] = v
+        resolved.append(out_item)
+    return resolved
+
+
+# Single-pass unit detection: the leftmost token in the spec wins (real
+# specs never mention two units), with per-category fallbacks hoisted to
+# module scope instead of being rebuilt on every call.
+_UNIT_RE = re.compile(r"kg|piece|pc|sack|tray")
+_UNIT_MAP = {"kg": "kg", "pc": "pc", "piece": "pc", "sack": "sack", "tray": "tray"}
+_CAT_DEFAULTS = {
+    "Rice": "kg",
+    "Meat": "kg",
+    "Fish": "kg",
+    "Vegetables": "kg",
+    "Fruits": "kg",
+}
 
 
 def _infer_unit(spec: str, category: str) -> str:
-    spec_lower = spec.lower()
-    if "kg" in spec_lower:
-        return "kg"
-    if "pc" in spec_lower or "piece" in spec_lower:
-        return "pc"
-    if "sack" in spec_lower:
-        return "sack"
-    if "tray" in spec_lower:
-        return "tray"
-    cat_defaults = {
-        "Rice": "kg",
-        "Meat": "kg",
-        "Fish": "kg",
-        "Vegetables": "kg",
-        "Fruits": "kg",
-    }
-    return cat_defaults.get(category, "kg")
+    m = _UNIT_RE.search(spec.lower())
+    if m:
+        return _UNIT_MAP[m.group(0)]
+    return _CAT_DEFAULTS.get(category, "kg")
 
 
 # ─── Commodity Comparison ─────────────────────────────────────────────────────
 
+_COMPARISON_COLS = [
+    "commodity",
+    "category",
+    "unit",
+    "latest_date",
+    "region",
+    "latest_price",
+    "7_day_change_pct",
+    "30_day_change_pct",
+    "volatility_score",
+    "volatility_value",
+    "momentum",
+]
+
+
 def build_commodity_comparison(dashboard: list[dict]) -> dict:
     """
     For each commodity, compare prices across all regions.
     Mirrors the CommodityComparison type.
     """
-    by_commodity = defaultdict(list)
-    for item in dashboard:
-        by_commodity[item["commodity"]].append(item)
+    base = pl.LazyFrame(
+        [{k: it[k] for k in _COMPARISON_COLS} for it in dashboard],
+        schema={
+            "commodity": pl.Utf8,
+            "category": pl.Utf8,
+            "unit": pl.Utf8,
+            "latest_date": pl.Utf8,
+            "region": pl.Utf8,
+            "latest_price": pl.Float64,
+            "7_day_change_pct": pl.Float64,
+            "30_day_change_pct": pl.Float64,
+            "volatility_score": pl.Utf8,
+            "volatility_value": pl.Float64,
+            "momentum": pl.Int64,
+        },
+    )
 
-    comparison = {}
-    for commodity, items in by_commodity.items():
-        prices = [it["latest_price"] for it in items]
-        if not prices:
-            continue
+    # Both rankings as window expressions over commodity; "ordinal" breaks
+    # ties by row order, matching the previous stable Python sorts. Zero
+    # volatility sorts to the end (999), as before.
+    ranked = base.with_columns([
+        pl.col("latest_price").rank("ordinal").over("commodity").alias("rank"),
+        pl.when(pl.col("volatility_value") == 0)
+        .then(999.0)
+        .otherwise(pl.col("volatility_value"))
+        .rank("ordinal")
+        .over("commodity")
+        .alias("stability_rank"),
+    ])
+
+    stats = base.group_by("commodity", maintain_order=True).agg([
+        pl.col("latest_price").min().alias("min_price"),
+        pl.col("latest_price").max().alias("max_price"),
+        pl.col("latest_price").mean().alias("avg_price"),
+        pl.col("category").first(),
+        pl.col("unit").first(),
+        pl.col("latest_date").first(),
+    ])
+
+    df = ranked.join(stats, on="commodity").collect()
 
-        regional_trends = sorted(
-            [
-                {
-                    "region": it["region"],
-                    "latest_price": it["latest_price"],
-                    "7_day_change_pct": it["7_day_change_pct"],
-                    "30_day_change_pct": it["30_day_change_pct"],
-                    "volatility_score": it["volatility_score"],
-                    "volatility_value": it["volatility_value"],
-                    "momentum": it["momentum"],
-                    "rank": 0,  # filled below
-                }
-                for it in items
-            ],
-            key=lambda x: x["latest_price"],
-        )
+    comparison = {}
+    for key, sub in df.partition_by("commodity", maintain_order=True, as_dict=True).items():
+        commodity = key[0]
+        first = sub.row(0, named=True)
+        min_price = first["min_price"]
+
+        regional_trends = [
+            {
+                "region": r["region"],
+                "latest_price": r["latest_price"],
+                "7_day_change_pct": r["7_day_change_pct"],
+                "30_day_change_pct": r["30_day_change_pct"],
+                "volatility_score": r["volatility_score"],
+                "volatility_value": r["volatility_value"],
+                "momentum": r["momentum"],
+                "rank": rank,
+            }
+            for rank, r in enumerate(sub.sort("rank").iter_rows(named=True), 1)
+        ]
 
-        for rank, rt in enumerate(regional_trends, 1):
-            rt["rank"] = rank
+        stability_ranking = [
+            {
+                "rank": rank,
+                "region": r["region"],
+                "volatility_score": r["volatility_score"],
+                "volatility_value": r["volatility_value"],
+            }
+            for rank, r in enumerate(
+                sub.filter(pl.col("volatility_value").is_not_null())
+                .sort("stability_rank")
+                .iter_rows(named=True),
+                1,
+            )
+        ]
 
         comparison[commodity] = {
             "commodity": commodity,
-            "category": items[0]["category"],
-            "unit": items[0]["unit"],
-            "latest_date": items[0]["latest_date"],
+            "category": first["category"],
+            "unit": first["unit"],
+            "latest_date": first["latest_date"],
             "national_stats": {
-                "min_price": min(prices),
-                "max_price": max(prices),
-                "avg_price": round(statistics.mean(prices), 2),
+                "min_price": min_price,
+                "max_price": first["max_price"],
+                "avg_price": round(first["avg_price"], 2),
                 "price_gap_pct": round(
-                    (max(prices) - min(prices)) / min(prices) * 100, 2
+                    (first["max_price"] - min_price) / min_price * 100, 2
                 )
-                if min(prices) > 0
+                if min_price > 0
                 else 0,
             },
             "regional_trends": regional_trends,
-            "stability_ranking": sorted(
-                [
-                    {
-                        "rank": 0,
-                        "region": it["region"],
-                        "volatility_score": it["volatility_score"],
-                        "volatility_value": it["volatility_value"],
-                    }
-                    for it in items
-                    if it["volatility_value"] is not None
-                ],
-                key=lambda x: (x["volatility_value"] or 999),
-            ),
+            "stability_ranking": stability_ranking,
         }
 
-        # Assign stability ranks
-        for rank, sr in enumerate(comparison[commodity]["stability_ranking"], 1):
-            sr["rank"] = rank
-
     return comparison
 
 
@@ -286,7 +496,7 @@ def build_region_view(dashboard: list[dict]) -> dict:
             "30_day_change_pct": item["30_day_change_pct"],
             "volatility_score": item["volatility_score"],
             "momentum": item["momentum"],
-            "trend": item["trend"],
+            "trend_idx": item["trend_idx"],
         })
 
     return view
@@ -298,36 +508,52 @@ def build_summary(
     dashboard: list[dict], market_data: dict
 ) -> dict:
     """Top-level KPIs and highlights. Mirrors SummaryStats type."""
-    all_regions = sorted({it["region"] for it in dashboard})
-    all_cats = sorted({it["category"] for it in dashboard})
-    all_commodities = sorted({it["commodity"] for it in dashboard})
+    # Single pass over dashboard: collect the distinct-value sets, the
+    # per-category buckets, the volatility candidates and the latest date
+    # all at once instead of six separate O(N) scans.
+    regions, cats, commodities = set(), set(), set()
+    cat_prices = defaultdict(list)
+    cat_commodities = defaultdict(set)
+    vol = []
+    latest_date = ""
+    for it in dashboard:
+        regions.add(it["region"])
+        cats.add(it["category"])
+        commodities.add(it["commodity"])
+        cat_prices[it["category"]].append(it["latest_price"])
+        cat_commodities[it["category"]].add(it["commodity"])
+        if it["volatility_value"] is not None:
+            vol.append(it)
+        if it["latest_date"] > latest_date:
+            latest_date = it["latest_date"]
+
+    all_regions = sorted(regions)
+    all_cats = sorted(cats)
+    all_commodities = sorted(commodities)
 
     # Category price ranges
     cat_stats = {}
     for cat in all_cats:
-        items = [it for it in dashboard if it["category"] == cat]
-        prices = [it["latest_price"] for it in items]
+        prices = cat_prices[cat]
         if prices:
             cat_stats[cat] = {
-                "commodities": len({it["commodity"] for it in items}),
+                "commodities": len(cat_commodities[cat]),
                 "min_price": round(min(prices), 2),
                 "max_price": round(max(prices), 2),
                 "avg_price": round(statistics.mean(prices), 2),
                 "median_price": round(statistics.median(prices), 2),
             }
 
-    # Most volatile
-    volatile_items = sorted(
-        [it for it in dashboard if it["volatility_value"] is not None],
-        key=lambda x: x["volatility_value"],
-        reverse=True,
-    )[:10]
-
-    # Most stable
-    stable_items = sorted(
-        [it for it in dashboard if it["volatility_value"] is not None and it["volatility_value"] > 0],
+    # Most volatile / most stable: top-10 selection is O(N log 10) with a
+    # heap instead of a full O(N log N) sort.
+    volatile_items = heapq.nlargest(
+        10, vol, key=lambda x: x["volatility_value"]
+    )
+    stable_items = heapq.nsmallest(
+        10,
+        (it for it in vol if it["volatility_value"] > 0),
         key=lambda x: x["volatility_value"],
-    )[:10]
+    )
 
     # Count total markets across all regions/categories
     total_markets = set()
@@ -336,8 +562,6 @@ def build_summary(
             for m in cat_data.get("markets", []):
                 total_markets.add(m)
 
-    latest_date = max((it["latest_date"] for it in dashboard), default="")
-
     return {
         "metadata": {
             "data_source": "Philippine Department of Agriculture - Bantay Presyo",
@@ -379,16 +603,33 @@ def build_summary(
 
 # ─── CSV Export ───────────────────────────────────────────────────────────────
 
-def export_csv(records: list[dict], path: str):
-    """Export flat records to CSV."""
-    if not records:
+def export_csv(records: pl.DataFrame, path: str):
+    """Export flat records to CSV via the native multi-threaded writer."""
+    if records.is_empty():
+        return
+    records.write_csv(path)
+
+
+def export_parquet(records: pl.DataFrame, path: str):
+    """Parquet variant of the flat export: smaller on disk, zero-copy loadable."""
+    if records.is_empty():
         return
-    fieldnames = ["date", "region", "category", "market", "commodity", "specification", "price"]
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in records:
-            writer.writerow({k: r.get(k, "") for k in fieldnames})
+    records.write_parquet(path)
+
+
+def _save_json(args: tuple) -> tuple[str, Optional[int]]:
+    """
+    Serialize and write one output file (runs in a worker process).
+    Returns (filename, bytes written), or (filename, None) if the existing
+    file was already byte-identical.
+    """
+    filename, data, out_dir = args
+    path = Path(out_dir) / filename
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if path.exists() and path.read_bytes() == payload:
+        return filename, None
+    path.write_bytes(payload)
+    return filename, len(payload)
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
@@ -397,16 +638,21 @@ def run(input_path: str, output_dir: str):
     print(f"Loading {input_path}...")
     market_data = load_market_data(input_path)
 
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
     print("Flattening records...")
-    records = flatten_records(market_data)
-    print(f"  {len(records)} price records found")
+    records = flatten_frame(market_data)
+    print(f"  {records.height} price records found")
 
-    if not records:
+    if records.is_empty():
         print("ERROR: No records to process. Check the scraper output.")
         sys.exit(1)
 
     print("Building regional dashboard...")
-    dashboard = build_regional_dashboard(records)
+    fingerprints = _cell_fingerprints(market_data)
+    agg = aggregate_incremental(records, fingerprints, CACHE_DIR)
+    dashboard, trends = build_regional_dashboard(agg)
     print(f"  {len(dashboard)} dashboard items")
 
     print("Building commodity comparison...")
@@ -418,29 +664,48 @@ def run(input_path: str, output_dir: str):
     print("Building summary statistics...")
     summary = build_summary(dashboard, market_data)
 
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
+    # Resolve trend indices to the shared trend lists only at the edge
+    region_view_out = {
+        region: {
+            **rv,
+            "categories": {
+                cat: _resolve_trends(items, trends)
+                for cat, items in rv["categories"].items()
+            },
+        }
+        for region, rv in region_view.items()
+    }
 
-    def save(filename: str, data):
-        path = out / filename
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        size = path.stat().st_size / 1024
-        print(f"  ✓ {filename} ({size:.1f} KB)")
+    outputs = [
+        ("market_comparison_data.json", market_data),
+        ("regional_dashboard.json", _resolve_trends(dashboard, trends)),
+        ("commodity_comparison.json", comparison),
+        ("region_view.json", region_view_out),
+        ("summary_statistics.json", summary),
+    ]
 
+    # The five writes are independent and CPU-bound on the serializer, so
+    # they run in parallel on separate cores.
     print(f"\nSaving to {output_dir}/")
-    save("market_comparison_data.json", market_data)
-    save("regional_dashboard.json", dashboard)
-    save("commodity_comparison.json", comparison)
-    save("region_view.json", region_view)
-    save("summary_statistics.json", summary)
-
-    # CSV export
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        tasks = [(fn, data, str(out)) for fn, data in outputs]
+        for filename, size in executor.map(_save_json, tasks):
+            if size is None:
+                print(f"  = {filename} (unchanged)")
+            else:
+                print(f"  ✓ {filename} ({size / 1024:.1f} KB)")
+
+    # Flat exports
     csv_path = out / "commodity_prices_latest.csv"
     export_csv(records, str(csv_path))
     size = csv_path.stat().st_size / 1024
     print(f"  ✓ commodity_prices_latest.csv ({size:.1f} KB)")
 
+    pq_path = out / "commodity_prices_latest.parquet"
+    export_parquet(records, str(pq_path))
+    size = pq_path.stat().st_size / 1024
+    print(f"  ✓ commodity_prices_latest.parquet ({size:.1f} KB)")
+
     print("\n✅ Pipeline complete.")
     print(f"   Regions: {summary['metadata']['regions_count']}")
     print(f"   Commodities: {summary['metadata']['commodities_count']}")
@@ -8,7 +8,7 @@
 #   ./run_pipeline.sh --dry-run     # Preview what would be scraped
 #
 # Requirements:
-#   pip install requests beautifulsoup4
+#   pip install httpx[http2] selectolax polars orjson
 # ============================================================
 
 set -euo pipefail
@@ -2,8 +2,12 @@
 Bantay Presyo Scraper
 """
 
-import requests
-import json
+import asyncio
+import hashlib
+import httpx
+import orjson
+import random
+import re
 import time
 import logging
 import argparse
@@ -11,7 +15,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 logging.basicConfig(
     level=logging.INFO,
@@ -52,6 +56,45 @@ REGIONS = {
     17: "BARMM (Bangsamoro Autonomous Region)",
 }
 
+# Politeness cap on concurrent in-flight requests; HTTP/2 multiplexes them
+# over a handful of connections, so this is cheap to raise or lower.
+CONCURRENCY = 16
+
+# On-disk response cache: reruns within the TTL (e.g. while debugging the
+# downstream pipeline) are served from disk with zero network traffic.
+CACHE_DIR = Path(__file__).resolve().parent / "logs" / "http_cache"
+CACHE_TTL = 86400  # seconds — prices are published daily
+
+
+def _cache_path(url: str, params: Optional[dict]) -> Path:
+    payload = url.encode("utf-8") + b"?" + orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS)
+    key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.html"
+
+
+def _cache_get(url: str, params: Optional[dict]) -> Optional[str]:
+    path = _cache_path(url, params)
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL:
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+
+def _cache_put(url: str, params: Optional[dict], text: str):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _cache_path(url, params).write_text(text, encoding="utf-8")
+
+# One precompiled substitution strips currency symbols, separators and
+# whitespace from a price cell in a single pass.
+_PRICE_RE = re.compile(r"[,₱]|PHP|\s")
+_NA = {"", "-", "N/A", "n/a", "na", "NA", "*"}
+
+# Report-date banner, e.g. "as of January 15, 2026" — matched on the raw
+# HTML so no DOM traversal is needed to find it.
+_AS_OF_RE = re.compile(r"as of\s+([A-Za-z]+\s+\d{1,2},\s*\d{4})", re.I)
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -64,60 +107,76 @@ HEADERS = {
 }
 
 
-def make_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update(HEADERS)
-    return s
+def make_client() -> httpx.AsyncClient:
+    # One client for the whole scrape: HTTP/2 multiplexes the in-flight
+    # requests over a few keep-alive connections.
+    return httpx.AsyncClient(http2=True, headers=HEADERS, follow_redirects=True)
 
 
-def fetch_page(
-    session: requests.Session,
+async def fetch_page(
+    client: httpx.AsyncClient,
     url: str,
     params: Optional[dict] = None,
+    sem: Optional[asyncio.Semaphore] = None,
     retries: int = 3,
     delay: float = 2.0,
+    use_cache: bool = True,
 ) -> Optional[str]:
+    if use_cache:
+        cached = _cache_get(url, params)
+        if cached is not None:
+            # Cache hits skip the politeness jitter — no request goes out.
+            return cached
+
+    sem = sem or asyncio.Semaphore(CONCURRENCY)
     for attempt in range(1, retries + 1):
         try:
-            resp = session.get(url, params=params, timeout=30)
+            async with sem:
+                await asyncio.sleep(random.uniform(0.1, 0.5))
+                resp = await client.get(url, params=params, timeout=30)
             resp.raise_for_status()
-            time.sleep(delay)
+            if use_cache:
+                _cache_put(url, params, resp.text)
             return resp.text
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             log.warning(f"Attempt {attempt}/{retries} failed for {url}: {e}")
             if attempt < retries:
-                time.sleep(delay * attempt)
+                await asyncio.sleep(delay * attempt)
     log.error(f"All retries failed for {url}")
     return None
 
 
 def parse_market_table(html: str, region_name: str, category: str) -> dict:
-    soup = BeautifulSoup(html, "html.parser")
-
+    # Pull the report date straight off the raw HTML; the regex also hits
+    # scripts/comments, so keep scanning past unparseable candidates and
+    # take the first one that is a real date. Falls back to today.
     report_date = datetime.now().strftime("%Y-%m-%d")
-    date_candidates = soup.find_all(string=lambda t: t and "as of" in t.lower())
-    for dc in date_candidates:
+    for m in _AS_OF_RE.finditer(html):
+        # Normalize spacing ("March 3,2026" → "March 3, 2026") for strptime
+        raw = " ".join(m.group(1).replace(",", ", ").split())
         try:
-            raw = dc.strip().lower().replace("as of", "").strip()
-            parsed = datetime.strptime(raw, "%B %d, %Y")
-            report_date = parsed.strftime("%Y-%m-%d")
+            report_date = datetime.strptime(raw, "%B %d, %Y").strftime("%Y-%m-%d")
             break
         except ValueError:
             continue
 
-    tables = soup.find_all("table")
+    # lexbor is a native-code DOM: parsing and the css() walks below are an
+    # order of magnitude faster than BeautifulSoup traversal.
+    tree = LexborHTMLParser(html)
+
+    tables = tree.css("table")
     data_table = None
     for tbl in tables:
-        headers = [th.get_text(strip=True) for th in tbl.find_all("th")]
+        headers = [th.text(strip=True) for th in tbl.css("th")]
         if any("market" in h.lower() or "commodity" in h.lower() for h in headers):
             data_table = tbl
             break
 
     if data_table is None:
         for tbl in tables:
-            rows = tbl.find_all("tr")
+            rows = tbl.css("tr")
             if len(rows) > 3:
-                first_row_cells = rows[0].find_all(["td", "th"])
+                first_row_cells = rows[0].css("td, th")
                 if len(first_row_cells) > 4:
                     data_table = tbl
                     break
@@ -126,34 +185,33 @@ def parse_market_table(html: str, region_name: str, category: str) -> dict:
         log.warning(f"No data table found for {region_name} / {category}")
         return {"date": report_date, "markets": [], "commodities": []}
 
-    rows = data_table.find_all("tr")
+    rows = data_table.css("tr")
     if not rows:
         return {"date": report_date, "markets": [], "commodities": []}
 
-    header_cells = rows[0].find_all(["th", "td"])
+    header_cells = rows[0].css("th, td")
     markets = []
     for cell in header_cells[2:]:
-        txt = cell.get_text(separator=" ", strip=True)
+        txt = cell.text(separator=" ", strip=True)
         if txt and txt.upper() not in ("RANGE", "MIN", "MAX", "AVG"):
             markets.append(txt.upper())
 
     commodities = []
     for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
+        cells = row.css("td, th")
         if len(cells) < 3:
             continue
 
-        commodity = cells[0].get_text(strip=True)
-        specification = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+        commodity = cells[0].text(strip=True)
+        specification = cells[1].text(strip=True) if len(cells) > 1 else ""
 
         if not commodity or commodity.upper() in ("COMMODITY", "ITEM"):
             continue
 
+        raw = [c.text(strip=True) for c in cells[2: 2 + len(markets)]]
         prices = []
-        for cell in cells[2: 2 + len(markets)]:
-            raw = cell.get_text(strip=True)
-            clean = raw.replace(",", "").replace("₱", "").replace("PHP", "").strip()
-            if clean in ("", "-", "N/A", "n/a", "na", "NA", "*"):
+        for clean in (_PRICE_RE.sub("", x) for x in raw):
+            if clean in _NA:
                 prices.append("N/A")
             else:
                 try:
@@ -177,17 +235,19 @@ def parse_market_table(html: str, region_name: str, category: str) -> dict:
     }
 
 
-def scrape_category_region(
-    session: requests.Session,
+async def scrape_category_region(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
     category_slug: str,
     region_id: int,
     region_name: str,
+    use_cache: bool = True,
 ) -> Optional[dict]:
     url = BASE_URL + CATEGORIES[category_slug]
     params = {"rid": region_id}
 
     log.info(f"  Fetching {category_slug.upper()} / {region_name}...")
-    html = fetch_page(session, url, params=params)
+    html = await fetch_page(client, url, params=params, sem=sem, use_cache=use_cache)
     if html is None:
         return None
 
@@ -197,34 +257,45 @@ def scrape_category_region(
     return result
 
 
-def scrape_all(
+async def _scrape_one(client, sem, cat_slug, region_id, use_cache):
+    data = await scrape_category_region(
+        client, sem, cat_slug, region_id, REGIONS[region_id], use_cache=use_cache
+    )
+    return cat_slug, region_id, data
+
+
+async def scrape_all_async(
     categories_to_scrape: Optional[list] = None,
     regions_to_scrape: Optional[list] = None,
+    use_cache: bool = True,
 ) -> dict:
-    session = make_session()
-
     cats = categories_to_scrape or list(CATEGORIES.keys())
     regs = regions_to_scrape or list(REGIONS.keys())
 
     result = {"regions": {}, "scrape_metadata": {}}
     scraped_at = datetime.now().isoformat()
 
+    for region_id in regs:
+        result["regions"][REGIONS[region_id]] = {}
+
+    sem = asyncio.Semaphore(CONCURRENCY)
     total = len(cats) * len(regs)
     done = 0
 
-    for region_id in regs:
-        region_name = REGIONS[region_id]
-        if region_name not in result["regions"]:
-            result["regions"][region_name] = {}
+    async with make_client() as client:
+        tasks = [
+            _scrape_one(client, sem, cat_slug, region_id, use_cache)
+            for region_id in regs
+            for cat_slug in cats
+        ]
+        for coro in asyncio.as_completed(tasks):
+            cat_slug, region_id, data = await coro
+            region_name = REGIONS[region_id]
 
-        for cat_slug in cats:
             done += 1
             log.info(f"[{done}/{total}] {region_name} — {cat_slug}")
-
-            data = scrape_category_region(session, cat_slug, region_id, region_name)
             if data and data["commodities"]:
-                cat_label = cat_slug.capitalize()
-                result["regions"][region_name][cat_label] = {
+                result["regions"][region_name][cat_slug.capitalize()] = {
                     "date": data["date"],
                     "markets": data["markets"],
                     "commodities": data["commodities"],
@@ -236,8 +307,6 @@ def scrape_all(
             else:
                 log.warning(f"    ✗ No data returned")
 
-            time.sleep(1.5)
-
     result["scrape_metadata"] = {
         "scraped_at": scraped_at,
         "source": BASE_URL,
@@ -251,6 +320,17 @@ def scrape_all(
     return result
 
 
+def scrape_all(
+    categories_to_scrape: Optional[list] = None,
+    regions_to_scrape: Optional[list] = None,
+    use_cache: bool = True,
+) -> dict:
+    """Synchronous entry point; drives the async scraper under one event loop."""
+    return asyncio.run(
+        scrape_all_async(categories_to_scrape, regions_to_scrape, use_cache=use_cache)
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Bantay Presyo Scraper")
     parser.add_argument(
@@ -274,6 +354,11 @@ def main():
         action="store_true",
         help="Print what would be scraped without fetching",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk HTTP cache and force a fresh fetch",
+    )
     args = parser.parse_args()
 
     cats = [args.category] if args.category else None
@@ -292,10 +377,9 @@ def main():
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     log.info("=== Bantay Presyo Scraper Starting ===")
-    data = scrape_all(cats, regs)
+    data = scrape_all(cats, regs, use_cache=not args.no_cache)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    out_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     log.info(f"=== Done. Output saved to {out_path} ===")
     meta = data["scrape_metadata"]